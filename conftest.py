@@ -0,0 +1,36 @@
+from pathlib import Path
+import getpass
+import hashlib
+import os
+
+import pytest
+
+
+def _user() -> str:
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError):
+        # No user variables and no passwd entry, e.g. in a container running under an arbitrary UID
+        return str(os.getuid()) if hasattr(os, "getuid") else "unknown"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    # Environments consist of many small files, so placing the temporary directories on a RAM disk
+    # speeds up the tests considerably. Set `PIXI_TEST_TMPFS=1` to use `/dev/shm` on Linux,
+    # or point it to an existing RAM disk. On macOS one can be created with:
+    # diskutil erasevolume APFS ramdisk $(hdiutil attach -nomount ram://4194304)
+    # and used with `PIXI_TEST_TMPFS=/Volumes/ramdisk`.
+    # This has to live in the root conftest, since `basetemp` is only read before
+    # the conftests of the test directories are loaded.
+    tmpfs = os.environ.get("PIXI_TEST_TMPFS")
+    # pytest-xdist workers get their `basetemp` from the controller
+    if not tmpfs or hasattr(config, "workerinput"):
+        return
+    ramdisk = Path("/dev/shm") if tmpfs == "1" else Path(tmpfs)
+    if not ramdisk.is_dir():
+        raise pytest.UsageError(f"PIXI_TEST_TMPFS: {ramdisk} is not a directory")
+    # A fixed name per user and checkout, so that every run replaces the previous one instead of
+    # filling the RAM disk, while concurrent runs from other checkouts don't remove each other's files
+    checkout = hashlib.sha256(str(config.rootpath).encode()).hexdigest()[:8]
+    config.option.basetemp = ramdisk.joinpath(f"pixi-tests-{_user()}-{checkout}")
@@ -4,56 +4,90 @@ import tomllib
 import pytest
 import tomli_w
 from .common import verify_cli_command, ExitCode
-import platform
+import sys
 import os
 import stat
 
 MANIFEST_VERSION = 1
+EXEC_EXTENSION = ".bat" if sys.platform == "win32" else ""
+
+# Environment `test` with `dummy-a` from `channel`
+DUMMY_A_MANIFEST = """
+[envs.test]
+channels = ["{channel}"]
+dependencies = {{ dummy-a = "*" }}
+"""
+
+# Environment `test` with `dummy-a` from `channel`, exposing `dummy-a`
+DUMMY_A_EXPOSED_MANIFEST = """
+[envs.test]
+channels = ["{channel}"]
+[envs.test.dependencies]
+dummy-a = "*"
+
+[envs.test.exposed]
+"dummy-a" = "dummy-a"
+"""
 
 
 def exec_extension(exe_name: str) -> str:
-    if platform.system() == "Windows":
-        return exe_name + ".bat"
-    else:
-        return exe_name
+    return exe_name + EXEC_EXTENSION
 
 
-@pytest.mark.slow
-def test_sync_dependencies(pixi: Path, tmp_path: Path) -> None:
-    env = {"PIXI_HOME": str(tmp_path)}
+@pytest.fixture
+def manifest_path(tmp_path: Path) -> Path:
+    """Path to the global manifest in `tmp_path`, its parent directory already exists"""
     manifests = tmp_path.joinpath("manifests")
     manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
+    return manifests.joinpath("pixi-global.toml")
+
+
+def bin_contents(pixi_home: Path) -> set[str]:
+    """Names of all entries in the `bin` directory of `pixi_home`"""
+    return {entry.name for entry in os.scandir(pixi_home / "bin")}
+
+
+@pytest.mark.slow
+def test_sync_dependencies(pixi: Path, tmp_path: Path, manifest_path: Path) -> None:
+    env = {"PIXI_HOME": str(tmp_path)}
     toml = """
     [envs.test]
     channels = ["conda-forge"]
-    dependencies = { python = "3.12" }
-    exposed = { "python-injected" = "python" }
+    dependencies = {{ {dependencies} }}
+    exposed = {{ "python-injected" = "python" }}
     """
-    parsed_toml = tomllib.loads(toml)
-    manifest.write_text(toml)
+    manifest_path.write_text(toml.format(dependencies='python = "3.12"'))
     python_injected = tmp_path / "bin" / exec_extension("python-injected")
 
     # Test basic commands
     verify_cli_command([pixi, "global", "sync"], env=env)
-    verify_cli_command([python_injected, "--version"], env=env, stdout_contains="3.12")
-    verify_cli_command([python_injected, "-c", "import numpy"], ExitCode.FAILURE, env=env)
+    verify_cli_command(
+        [python_injected, "-c", "import sys; print(sys.version); import numpy"],
+        ExitCode.FAILURE,
+        env=env,
+        stdout_contains="3.12",
+        stderr_contains="No module named 'numpy'",
+    )
+
+    # Syncing again without changes takes the fast path
+    verify_cli_command(
+        [pixi, "global", "sync"],
+        env=env,
+        stderr_contains="Nothing to do. The pixi global installation is already up-to-date.",
+    )
 
     # Add numpy
-    parsed_toml["envs"]["test"]["dependencies"]["numpy"] = "*"
-    manifest.write_text(tomli_w.dumps(parsed_toml))
+    manifest_path.write_text(toml.format(dependencies='python = "3.12", numpy = "*"'))
     verify_cli_command([pixi, "global", "sync"], env=env)
     verify_cli_command([python_injected, "-c", "import numpy"], env=env)
 
     # Remove numpy again
-    del parsed_toml["envs"]["test"]["dependencies"]["numpy"]
-    manifest.write_text(tomli_w.dumps(parsed_toml))
+    manifest_path.write_text(toml.format(dependencies='python = "3.12"'))
     verify_cli_command([pixi, "global", "sync"], env=env)
     verify_cli_command([python_injected, "-c", "import numpy"], ExitCode.FAILURE, env=env)
 
     # Remove python
-    del parsed_toml["envs"]["test"]["dependencies"]["python"]
-    manifest.write_text(tomli_w.dumps(parsed_toml))
+    manifest_path.write_text(toml.format(dependencies=""))
     verify_cli_command(
         [pixi, "global", "sync"],
         ExitCode.FAILURE,
@@ -63,26 +97,21 @@ def test_sync_dependencies(pixi: Path, tmp_path: Path) -> None:
 
 
 @pytest.mark.slow
-def test_sync_platform(pixi: Path, tmp_path: Path) -> None:
+def test_sync_platform(pixi: Path, tmp_path: Path, manifest_path: Path) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
     toml = """
     [envs.test]
     channels = ["conda-forge"]
     platform = "win-64"
     dependencies = { binutils = "2.40" }\
     """
-    parsed_toml = tomllib.loads(toml)
-    manifest.write_text(toml)
+    manifest_path.write_text(toml)
 
     # Exists on win-64
     verify_cli_command([pixi, "global", "sync"], env=env)
 
-    # Doesn't exist on osx-64
-    parsed_toml["envs"]["test"]["platform"] = "osx-64"
-    manifest.write_text(tomli_w.dumps(parsed_toml))
+    # Doesn't exist on osx-64, the existing win-64 environment is not in sync anymore
+    manifest_path.write_text(toml.replace("win-64", "osx-64"))
     verify_cli_command(
         [pixi, "global", "sync"],
         ExitCode.FAILURE,
@@ -91,22 +120,13 @@ def test_sync_platform(pixi: Path, tmp_path: Path) -> None:
     )
 
 
-def test_sync_change_expose(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
+def test_sync_change_expose(
+    pixi: Path, tmp_path: Path, manifest_path: Path, dummy_channel_1: str
+) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
-    toml = f"""
-    [envs.test]
-    channels = ["{dummy_channel_1}"]
-    [envs.test.dependencies]
-    dummy-a = "*"
-
-    [envs.test.exposed]
-    "dummy-a" = "dummy-a"
-    """
+    toml = DUMMY_A_EXPOSED_MANIFEST.format(channel=dummy_channel_1)
     parsed_toml = tomllib.loads(toml)
-    manifest.write_text(toml)
+    manifest_path.write_text(toml)
     dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
 
     # Test basic commands
@@ -116,32 +136,23 @@ def test_sync_change_expose(pixi: Path, tmp_path: Path, dummy_channel_1: str) ->
     # Add another expose
     dummy_in_disguise = tmp_path / "bin" / exec_extension("dummy-in-disguise")
     parsed_toml["envs"]["test"]["exposed"]["dummy-in-disguise"] = "dummy-a"
-    manifest.write_text(tomli_w.dumps(parsed_toml))
+    manifest_path.write_text(tomli_w.dumps(parsed_toml))
     verify_cli_command([pixi, "global", "sync"], env=env)
     assert dummy_in_disguise.is_file()
 
     # Remove expose again
     del parsed_toml["envs"]["test"]["exposed"]["dummy-in-disguise"]
-    manifest.write_text(tomli_w.dumps(parsed_toml))
+    manifest_path.write_text(tomli_w.dumps(parsed_toml))
     verify_cli_command([pixi, "global", "sync"], env=env)
     assert not dummy_in_disguise.is_file()
 
 
-def test_sync_manually_remove_binary(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
+def test_sync_manually_remove_binary(
+    pixi: Path, tmp_path: Path, manifest_path: Path, dummy_channel_1: str
+) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
-    toml = f"""
-    [envs.test]
-    channels = ["{dummy_channel_1}"]
-    [envs.test.dependencies]
-    dummy-a = "*"
-
-    [envs.test.exposed]
-    "dummy-a" = "dummy-a"
-    """
-    manifest.write_text(toml)
+    toml = DUMMY_A_EXPOSED_MANIFEST.format(channel=dummy_channel_1)
+    manifest_path.write_text(toml)
     dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
 
     # Test basic commands
@@ -158,12 +169,9 @@ def test_sync_manually_remove_binary(pixi: Path, tmp_path: Path, dummy_channel_1
 
 @pytest.mark.slow
 def test_sync_migrate(
-    pixi: Path, tmp_path: Path, dummy_channel_1: str, dummy_channel_2: str
+    pixi: Path, tmp_path: Path, manifest_path: Path, dummy_channel_1: str, dummy_channel_2: str
 ) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
     toml = f"""\
 version = {MANIFEST_VERSION}
 # Test with special channel
@@ -185,23 +193,28 @@ channels = ["conda-forge"]
 dependencies = {{ xz = "*" }}
 exposed = {{ xz = "xz" }}
 """
-    manifest.write_text(toml)
+    manifest_path.write_text(toml)
     verify_cli_command([pixi, "global", "sync"], env=env)
 
     # Test migration from existing environments
-    original_manifest = manifest.read_text()
-    manifest.unlink()
-    manifests.rmdir()
-    verify_cli_command([pixi, "global", "sync"], env=env)
-    migrated_manifest = manifest.read_text()
+    original_manifest = manifest_path.read_text()
+    manifest_path.unlink()
+    manifest_path.parent.rmdir()
+    # The migrated manifest matches the installed environments, so nothing is re-solved
+    verify_cli_command(
+        [pixi, "global", "sync"],
+        env=env,
+        stderr_contains="Nothing to do. The pixi global installation is already up-to-date.",
+    )
+    migrated_manifest = manifest_path.read_text()
+    # Comments and formatting are lost during migration, so compare the parsed documents
     assert tomllib.loads(migrated_manifest) == tomllib.loads(original_manifest)
 
 
-def test_sync_duplicated_expose_error(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
+def test_sync_duplicated_expose_error(
+    pixi: Path, tmp_path: Path, manifest_path: Path, dummy_channel_1: str
+) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
     toml = f"""
 version = {MANIFEST_VERSION}
 
@@ -215,7 +228,7 @@ channels = ["{dummy_channel_1}"]
 dependencies = {{ dummy-b = "*" }}
 exposed = {{ dummy-1 = "dummy-b" }}
     """
-    manifest.write_text(toml)
+    manifest_path.write_text(toml)
     verify_cli_command(
         [pixi, "global", "sync"],
         ExitCode.FAILURE,
@@ -224,11 +237,10 @@ exposed = {{ dummy-1 = "dummy-b" }}
     )
 
 
-def test_sync_clean_up_broken_exec(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
+def test_sync_clean_up_broken_exec(
+    pixi: Path, tmp_path: Path, manifest_path: Path, dummy_channel_1: str
+) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
     toml = f"""
 version = {MANIFEST_VERSION}
 
@@ -237,13 +249,13 @@ channels = ["{dummy_channel_1}"]
 dependencies = {{ dummy-a = "*" }}
 exposed = {{ dummy-1 = "dummy-a" }}
     """
-    manifest.write_text(toml)
+    manifest_path.write_text(toml)
 
-    bin_dir = manifests = tmp_path.joinpath("bin")
+    bin_dir = tmp_path.joinpath("bin")
     bin_dir.mkdir()
     broken_exec = bin_dir.joinpath("broken.com")
     broken_exec.write_text("Hello world")
-    if platform.system() != "Windows":
+    if sys.platform != "win32":
         os.chmod(broken_exec, os.stat(broken_exec).st_mode | stat.S_IEXEC)
 
     verify_cli_command(
@@ -253,20 +265,13 @@ exposed = {{ dummy-1 = "dummy-a" }}
     assert not broken_exec.is_file()
 
 
-def test_expose_basic(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
+def test_expose_basic(
+    pixi: Path, tmp_path: Path, manifest_path: Path, dummy_channel_1: str
+) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
-    toml = f"""
-    [envs.test]
-    channels = ["{dummy_channel_1}"]
-    dependencies = {{ dummy-a = "*" }}
-    """
-    manifest.write_text(toml)
+    toml = DUMMY_A_MANIFEST.format(channel=dummy_channel_1)
+    manifest_path.write_text(toml)
     dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
-    dummy1 = tmp_path / "bin" / exec_extension("dummy1")
-    dummy3 = tmp_path / "bin" / exec_extension("dummy3")
 
     # Add dummy-a with simple syntax
     verify_cli_command(
@@ -281,8 +286,9 @@ def test_expose_basic(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
         [pixi, "global", "expose", "add", "--environment=test", "dummy1=dummy-a", "dummy3=dummy-a"],
         env=env,
     )
-    assert dummy1.is_file()
-    assert dummy3.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy1") in exposed
+    assert exec_extension("dummy3") in exposed
 
     # Remove dummy-a
     verify_cli_command(
@@ -298,21 +304,17 @@ def test_expose_basic(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
         env=env,
         stderr_contains="Exposed name dummy2 not found in any environment",
     )
-    assert not dummy1.is_file()
-    assert not dummy3.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy1") not in exposed
+    assert exec_extension("dummy3") not in exposed
 
 
-def test_expose_revert_working(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
+def test_expose_revert_working(
+    pixi: Path, tmp_path: Path, manifest_path: Path, dummy_channel_1: str
+) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
-    original_toml = f"""
-    [envs.test]
-    channels = ["{dummy_channel_1}"]
-    dependencies = {{ dummy-a = "*" }}
-    """
-    manifest.write_text(original_toml)
+    original_toml = DUMMY_A_MANIFEST.format(channel=dummy_channel_1)
+    manifest_path.write_text(original_toml)
 
     # Attempt to add executable dummy-b that is not in our dependencies
     verify_cli_command(
@@ -323,14 +325,13 @@ def test_expose_revert_working(pixi: Path, tmp_path: Path, dummy_channel_1: str)
     )
 
     # The TOML has been reverted to the original state
-    assert manifest.read_text() == original_toml
+    assert manifest_path.read_text() == original_toml
 
 
-def test_expose_preserves_table_format(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
+def test_expose_preserves_table_format(
+    pixi: Path, tmp_path: Path, manifest_path: Path, dummy_channel_1: str
+) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
     original_toml = f"""
 version = {MANIFEST_VERSION}
 
@@ -341,25 +342,22 @@ dummy-a = "*"
 [envs.test.exposed]
 dummy-a = "dummy-a"
 """
-    manifest.write_text(original_toml)
+    manifest_path.write_text(original_toml)
 
     verify_cli_command(
         [pixi, "global", "expose", "add", "--environment=test", "dummy-aa=dummy-a"],
         ExitCode.SUCCESS,
         env=env,
     )
-    print(manifest.read_text())
+    print(manifest_path.read_text())
     # The tables in the manifest have been preserved
-    assert manifest.read_text() == original_toml + 'dummy-aa = "dummy-a"\n'
+    assert manifest_path.read_text() == original_toml + 'dummy-aa = "dummy-a"\n'
 
 
 def test_expose_duplicated_expose_allow_for_same_env(
-    pixi: Path, tmp_path: Path, dummy_channel_1: str
+    pixi: Path, tmp_path: Path, manifest_path: Path, dummy_channel_1: str
 ) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
     toml = f"""
 version = {MANIFEST_VERSION}
 
@@ -373,7 +371,7 @@ channels = ["{dummy_channel_1}"]
 dependencies = {{ dummy-a = "*", dummy-b = "*" }}
 exposed = {{ dummy-2 = "dummy-a" }}
 """
-    manifest.write_text(toml)
+    manifest_path.write_text(toml)
 
     verify_cli_command(
         [pixi, "global", "sync"],
@@ -393,17 +391,14 @@ exposed = {{ dummy-2 = "dummy-a" }}
         [pixi, "global", "expose", "add", "--environment", "two", "dummy-2=dummy-b"],
         env=env,
     )
-    parsed_toml = tomllib.loads(manifest.read_text())
+    parsed_toml = tomllib.loads(manifest_path.read_text())
     assert parsed_toml["envs"]["two"]["exposed"]["dummy-2"] == "dummy-b"
 
 
 def test_install_duplicated_expose_allow_for_same_env(
-    pixi: Path, tmp_path: Path, dummy_channel_1: str
+    pixi: Path, tmp_path: Path, manifest_path: Path, dummy_channel_1: str
 ) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
 
     verify_cli_command(
         [
@@ -451,22 +446,21 @@ def test_install_duplicated_expose_allow_for_same_env(
         ],
         env=env,
     )
-    parsed_toml = tomllib.loads(manifest.read_text())
+    parsed_toml = tomllib.loads(manifest_path.read_text())
     assert parsed_toml["envs"]["dummy-a"]["exposed"]["dummy"] == "dummy-aa"
 
 
-def test_install_adapts_manifest(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
+def test_install_adapts_manifest(
+    pixi: Path, tmp_path: Path, manifest_path: Path, dummy_channel_1: str
+) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
     original_toml = f"""
     [envs.test]
     channels = ["{dummy_channel_1}"]
     dependencies= {{ dummy-b = "*" }}
     exposed = {{ dummy-b = "dummy-b" }}
     """
-    manifest.write_text(original_toml)
+    manifest_path.write_text(original_toml)
 
     verify_cli_command(
         [
@@ -480,7 +474,7 @@ def test_install_adapts_manifest(pixi: Path, tmp_path: Path, dummy_channel_1: st
         env=env,
     )
 
-    assert f"version = {MANIFEST_VERSION}" in manifest.read_text()
+    assert f"version = {MANIFEST_VERSION}" in manifest_path.read_text()
 
 
 def test_existing_manifest_gets_version(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
@@ -519,11 +513,6 @@ def test_install_with_basic(pixi: Path, tmp_path: Path, dummy_channel_1: str) ->
     manifests = tmp_path.joinpath("manifests")
     manifest = manifests.joinpath("pixi-global.toml")
 
-    dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
-    dummy_aa = tmp_path / "bin" / exec_extension("dummy-aa")
-    dummy_b = tmp_path / "bin" / exec_extension("dummy-b")
-    dummy_c = tmp_path / "bin" / exec_extension("dummy-c")
-
     # Should fail, since two environments are created
     verify_cli_command(
         [
@@ -571,10 +560,11 @@ exposed = {{ dummy-a = "dummy-a", dummy-aa = "dummy-aa" }}
     # Ensure that the manifest is correctly adapted
     assert actual_manifest == expected_manifest
 
-    assert dummy_a.is_file()
-    assert dummy_aa.is_file()
-    assert not dummy_b.is_file()
-    assert not dummy_c.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy-a") in exposed
+    assert exec_extension("dummy-aa") in exposed
+    assert exec_extension("dummy-b") not in exposed
+    assert exec_extension("dummy-c") not in exposed
 
 
 def test_install_with_environment_no_expose(
@@ -584,10 +574,6 @@ def test_install_with_environment_no_expose(
     manifests = tmp_path.joinpath("manifests")
     manifest = manifests.joinpath("pixi-global.toml")
 
-    dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
-    dummy_aa = tmp_path / "bin" / exec_extension("dummy-aa")
-    dummy_b = tmp_path / "bin" / exec_extension("dummy-b")
-
     verify_cli_command(
         [
             pixi,
@@ -617,9 +603,10 @@ exposed = {{ dummy-a = "dummy-a", dummy-aa = "dummy-aa" }}
     # Ensure that the manifest is correctly adapted
     assert actual_manifest == expected_manifest
 
-    assert dummy_a.is_file()
-    assert dummy_aa.is_file()
-    assert not dummy_b.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy-a") in exposed
+    assert exec_extension("dummy-aa") in exposed
+    assert exec_extension("dummy-b") not in exposed
 
 
 def test_install_with_environment_and_expose(
@@ -629,10 +616,6 @@ def test_install_with_environment_and_expose(
     manifests = tmp_path.joinpath("manifests")
     manifest = manifests.joinpath("pixi-global.toml")
 
-    dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
-    dummy_aa = tmp_path / "bin" / exec_extension("dummy-aa")
-    dummy_b = tmp_path / "bin" / exec_extension("dummy-b")
-
     verify_cli_command(
         [
             pixi,
@@ -663,9 +646,10 @@ exposed = {{ dummy-b = "dummy-b" }}
     # Ensure that the manifest is correctly adapted
     assert actual_manifest == expected_manifest
 
-    assert not dummy_a.is_file()
-    assert not dummy_aa.is_file()
-    assert dummy_b.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy-a") not in exposed
+    assert exec_extension("dummy-aa") not in exposed
+    assert exec_extension("dummy-b") in exposed
 
 
 def test_install_twice(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
@@ -852,11 +836,6 @@ def test_install_underscore(pixi: Path, tmp_path: Path, dummy_channel_1: str) ->
 def test_install_multiple_packages(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
 
-    dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
-    dummy_aa = tmp_path / "bin" / exec_extension("dummy-aa")
-    dummy_b = tmp_path / "bin" / exec_extension("dummy-b")
-    dummy_c = tmp_path / "bin" / exec_extension("dummy-c")
-
     # Install dummy-a and dummy-b, even though dummy-c is a dependency of dummy-b, it should not be exposed
     # All of dummy-a's and dummy-b's executables should be exposed though: 'dummy-a', 'dummy-aa' and 'dummy-b'
     verify_cli_command(
@@ -871,19 +850,16 @@ def test_install_multiple_packages(pixi: Path, tmp_path: Path, dummy_channel_1:
         ],
         env=env,
     )
-    assert dummy_a.is_file()
-    assert dummy_aa.is_file()
-    assert dummy_b.is_file()
-    assert not dummy_c.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy-a") in exposed
+    assert exec_extension("dummy-aa") in exposed
+    assert exec_extension("dummy-b") in exposed
+    assert exec_extension("dummy-c") not in exposed
 
 
 def test_install_expose_single_package(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
 
-    dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
-    dummy_aa = tmp_path / "bin" / exec_extension("dummy-aa")
-    dummy_c = tmp_path / "bin" / exec_extension("dummy-c")
-
     # Install dummy-a, even though dummy-c is a dependency, it should not be exposed
     # All of dummy-a's executables should be exposed though: 'dummy-a' and 'dummy-aa'
     verify_cli_command(
@@ -897,9 +873,10 @@ def test_install_expose_single_package(pixi: Path, tmp_path: Path, dummy_channel
         ],
         env=env,
     )
-    assert dummy_a.is_file()
-    assert dummy_aa.is_file()
-    assert not dummy_c.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy-a") in exposed
+    assert exec_extension("dummy-aa") in exposed
+    assert exec_extension("dummy-c") not in exposed
 
     # Install dummy-a, and expose dummy-c explicitly
     # Only dummy-c should now be exposed
@@ -916,9 +893,10 @@ def test_install_expose_single_package(pixi: Path, tmp_path: Path, dummy_channel
         ],
         env=env,
     )
-    assert not dummy_a.is_file()
-    assert not dummy_aa.is_file()
-    assert dummy_c.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy-a") not in exposed
+    assert exec_extension("dummy-aa") not in exposed
+    assert exec_extension("dummy-c") in exposed
 
     # Multiple mappings works as well
     verify_cli_command(
@@ -938,17 +916,15 @@ def test_install_expose_single_package(pixi: Path, tmp_path: Path, dummy_channel
         ],
         env=env,
     )
-    assert dummy_a.is_file()
-    assert dummy_aa.is_file()
-    assert dummy_c.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy-a") in exposed
+    assert exec_extension("dummy-aa") in exposed
+    assert exec_extension("dummy-c") in exposed
 
 
 def test_install_expose_multiple_packages(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
 
-    dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
-    dummy_b = tmp_path / "bin" / exec_extension("dummy-b")
-
     # Expose doesn't work with multiple environments
     verify_cli_command(
         [
@@ -985,17 +961,14 @@ def test_install_expose_multiple_packages(pixi: Path, tmp_path: Path, dummy_chan
         env=env,
     )
 
-    assert dummy_a.is_file()
-    assert not dummy_b.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy-a") in exposed
+    assert exec_extension("dummy-b") not in exposed
 
 
 def test_install_only_reverts_failing(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
 
-    dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
-    dummy_b = tmp_path / "bin" / exec_extension("dummy-b")
-    dummy_x = tmp_path / "bin" / exec_extension("dummy-x")
-
     # dummy-x is not part of dummy_channel_1
     verify_cli_command(
         [pixi, "global", "install", "--channel", dummy_channel_1, "dummy-a", "dummy-b", "dummy-x"],
@@ -1005,26 +978,35 @@ def test_install_only_reverts_failing(pixi: Path, tmp_path: Path, dummy_channel_
     )
 
     # dummy-a, dummy-b should be installed, but not dummy-x
-    assert dummy_a.is_file()
-    assert dummy_b.is_file()
-    assert not dummy_x.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy-a") in exposed
+    assert exec_extension("dummy-b") in exposed
+    assert exec_extension("dummy-x") not in exposed
 
 
 @pytest.mark.slow
-def test_install_platform(pixi: Path, tmp_path: Path) -> None:
+# binutils 2.40 exists on win-64, but not on osx-64
+@pytest.mark.parametrize(
+    ("target_platform", "expected_exit_code", "expected_stderr"),
+    [
+        ("win-64", ExitCode.SUCCESS, None),
+        ("osx-64", ExitCode.FAILURE, "No candidates were found"),
+    ],
+    ids=["win-64", "osx-64"],
+)
+def test_install_platform(
+    pixi: Path,
+    tmp_path: Path,
+    target_platform: str,
+    expected_exit_code: ExitCode,
+    expected_stderr: str | None,
+) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    # Exists on win-64
     verify_cli_command(
-        [pixi, "global", "install", "--platform", "win-64", "binutils=2.40"],
+        [pixi, "global", "install", "--platform", target_platform, "binutils=2.40"],
+        expected_exit_code,
         env=env,
-    )
-
-    # Doesn't exist on osx-64
-    verify_cli_command(
-        [pixi, "global", "install", "--platform", "osx-64", "binutils=2.40"],
-        ExitCode.FAILURE,
-        env=env,
-        stderr_contains="No candidates were found",
+        stderr_contains=expected_stderr,
     )
 
 
@@ -1032,8 +1014,6 @@ def test_install_channels(
     pixi: Path, tmp_path: Path, dummy_channel_1: str, dummy_channel_2: str
 ) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    dummy_b = tmp_path / "bin" / exec_extension("dummy-b")
-    dummy_x = tmp_path / "bin" / exec_extension("dummy-x")
 
     # Install dummy-b from dummy-channel-1
     verify_cli_command(
@@ -1047,7 +1027,7 @@ def test_install_channels(
         ],
         env=env,
     )
-    assert dummy_b.is_file()
+    assert exec_extension("dummy-b") in bin_contents(tmp_path)
 
     # Install dummy-x from dummy-channel-2
     verify_cli_command(
@@ -1061,7 +1041,7 @@ def test_install_channels(
         ],
         env=env,
     )
-    assert dummy_x.is_file()
+    assert exec_extension("dummy-x") in bin_contents(tmp_path)
 
     # Install dummy-b and dummy-x from dummy-channel-1 and dummy-channel-2
     verify_cli_command(
@@ -1078,8 +1058,9 @@ def test_install_channels(
         ],
         env=env,
     )
-    assert dummy_b.is_file()
-    assert dummy_x.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy-b") in exposed
+    assert exec_extension("dummy-x") in exposed
 
 
 def test_install_multi_env_install(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
@@ -1100,19 +1081,17 @@ def test_install_multi_env_install(pixi: Path, tmp_path: Path, dummy_channel_1:
     )
 
 
-@pytest.mark.skipif(platform.system() == "Windows", reason="Not reliable on Windows")
+@pytest.mark.skipif(sys.platform == "win32", reason="Not reliable on Windows")
 def test_pixi_install_cleanup(pixi: Path, tmp_path: Path, global_update_channel_1: str) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
 
-    package0_1_0 = tmp_path / "bin" / exec_extension("package0.1.0")
-    package0_2_0 = tmp_path / "bin" / exec_extension("package0.2.0")
-
     verify_cli_command(
         [pixi, "global", "install", "--channel", global_update_channel_1, "package==0.1.0"],
         env=env,
     )
-    assert package0_1_0.is_file()
-    assert not package0_2_0.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("package0.1.0") in exposed
+    assert exec_extension("package0.2.0") not in exposed
 
     # Install the same package but with a different version
     # The old version should be removed and the new version should be installed without error.
@@ -1120,14 +1099,14 @@ def test_pixi_install_cleanup(pixi: Path, tmp_path: Path, global_update_channel_
         [pixi, "global", "install", "--channel", global_update_channel_1, "package==0.2.0"],
         env=env,
     )
-    assert not package0_1_0.is_file()
-    assert package0_2_0.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("package0.1.0") not in exposed
+    assert exec_extension("package0.2.0") in exposed
 
 
+@pytest.mark.usefixtures("manifest_path")
 def test_list(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
 
     # Verify empty list
     verify_cli_command(
@@ -1158,10 +1137,9 @@ def test_list(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
     )
 
 
+@pytest.mark.usefixtures("manifest_path")
 def test_list_with_filter(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
 
     # Install dummy-a and dummy-b from dummy-channel-1
     verify_cli_command(
@@ -1198,12 +1176,8 @@ def test_list_with_filter(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> N
 # Test that we correctly uninstall the required packages
 # - Checking that the binaries are removed
 # - Checking that the non-requested to remove binaries are still there
-def test_uninstall(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
+def test_uninstall(pixi: Path, tmp_path: Path, manifest_path: Path, dummy_channel_1: str) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
-
-    manifests = tmp_path.joinpath("manifests")
-    manifests.mkdir()
-    manifest = manifests.joinpath("pixi-global.toml")
     original_toml = f"""
 version = {MANIFEST_VERSION}
 [envs.dummy-a]
@@ -1221,7 +1195,7 @@ channels = ["{dummy_channel_1}"]
 dependencies = {{ dummy-c = "*" }}
 exposed = {{ dummy-c = "dummy-c" }}
 """
-    manifest.write_text(original_toml)
+    manifest_path.write_text(original_toml)
 
     verify_cli_command(
         [
@@ -1231,14 +1205,13 @@ exposed = {{ dummy-c = "dummy-c" }}
         ],
         env=env,
     )
-    dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
-    dummy_aa = tmp_path / "bin" / exec_extension("dummy-aa")
-    dummy_b = tmp_path / "bin" / exec_extension("dummy-b")
-    dummy_c = tmp_path / "bin" / exec_extension("dummy-c")
-    assert dummy_a.is_file()
-    assert dummy_aa.is_file()
-    assert dummy_b.is_file()
-    assert dummy_c.is_file()
+    all_exposed = {
+        exec_extension("dummy-a"),
+        exec_extension("dummy-aa"),
+        exec_extension("dummy-b"),
+        exec_extension("dummy-c"),
+    }
+    assert all_exposed <= bin_contents(tmp_path)
 
     # Uninstall dummy-a
     verify_cli_command(
@@ -1246,14 +1219,14 @@ exposed = {{ dummy-c = "dummy-c" }}
         env=env,
         stderr_contains="Removed environment dummy-a",
     )
-    assert not dummy_a.is_file()
-    assert not dummy_aa.is_file()
-    assert dummy_b.is_file()
-    assert dummy_c.is_file()
+    assert bin_contents(tmp_path) & all_exposed == {
+        exec_extension("dummy-b"),
+        exec_extension("dummy-c"),
+    }
     # Verify only the dummy-a environment is removed
-    assert tmp_path.joinpath("envs", "dummy-b").is_dir()
-    assert tmp_path.joinpath("envs", "dummy-c").is_dir()
-    assert not tmp_path.joinpath("envs", "dummy-a").is_dir()
+    envs = set(os.listdir(tmp_path / "envs"))
+    assert {"dummy-b", "dummy-c"} <= envs
+    assert "dummy-a" not in envs
 
     # Remove dummy-b manually from manifest
     modified_toml = f"""
@@ -1264,18 +1237,15 @@ channels = ["{dummy_channel_1}"]
 dependencies = {{ dummy-c = "*" }}
 exposed = {{ dummy-c = "dummy-c" }}
 """
-    manifest.write_text(modified_toml)
+    manifest_path.write_text(modified_toml)
 
     # Uninstall dummy-c
     verify_cli_command(
         [pixi, "global", "uninstall", "dummy-c"],
         env=env,
     )
-    assert not dummy_a.is_file()
-    assert not dummy_aa.is_file()
-    assert not dummy_c.is_file()
     # Verify only the dummy-c environment is removed, dummy-b is still there as no sync is run.
-    assert dummy_b.is_file()
+    assert bin_contents(tmp_path) & all_exposed == {exec_extension("dummy-b")}
 
     # Verify empty list
     verify_cli_command(
@@ -1293,7 +1263,7 @@ exposed = {{ dummy-c = "dummy-c" }}
     )
 
     # Uninstall multiple packages
-    manifest.write_text(original_toml)
+    manifest_path.write_text(original_toml)
 
     verify_cli_command(
         [
@@ -1303,27 +1273,18 @@ exposed = {{ dummy-c = "dummy-c" }}
         ],
         env=env,
     )
-    assert dummy_a.is_file()
-    assert dummy_aa.is_file()
-    assert dummy_b.is_file()
-    assert dummy_c.is_file()
+    assert all_exposed <= bin_contents(tmp_path)
 
     verify_cli_command(
         [pixi, "global", "uninstall", "dummy-a", "dummy-b"],
         env=env,
     )
-    assert not dummy_a.is_file()
-    assert not dummy_aa.is_file()
-    assert not dummy_b.is_file()
-    assert dummy_c.is_file()
+    assert bin_contents(tmp_path) & all_exposed == {exec_extension("dummy-c")}
 
 
 def test_uninstall_only_reverts_failing(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
 
-    dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
-    dummy_b = tmp_path / "bin" / exec_extension("dummy-b")
-
     verify_cli_command(
         [pixi, "global", "install", "--channel", dummy_channel_1, "dummy-a", "dummy-b"],
         env=env,
@@ -1338,10 +1299,12 @@ def test_uninstall_only_reverts_failing(pixi: Path, tmp_path: Path, dummy_channe
     )
 
     # dummy-a has been removed but dummy-b is still there
-    assert not dummy_a.is_file()
-    assert not tmp_path.joinpath("envs", "dummy-a").is_dir()
-    assert dummy_b.is_file()
-    assert tmp_path.joinpath("envs", "dummy-b").is_dir()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy-a") not in exposed
+    assert exec_extension("dummy-b") in exposed
+    envs = set(os.listdir(tmp_path / "envs"))
+    assert "dummy-a" not in envs
+    assert "dummy-b" in envs
 
 
 def test_global_update_single_package(
@@ -1367,15 +1330,13 @@ def test_global_update_single_package(
         env=env,
         stderr_contains="Updated package package 0.1.0 -> 0.2.0 in environment package.",
     )
-    package = tmp_path / "bin" / exec_extension("package")
-    package0_1_0 = tmp_path / "bin" / exec_extension("package0.1.0")
-    package0_2_0 = tmp_path / "bin" / exec_extension("package0.2.0")
 
     # After update be left with only the binary that was in both versions.
-    assert package.is_file()
-    assert not package0_1_0.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("package") in exposed
+    assert exec_extension("package0.1.0") not in exposed
     # pixi global update should add new exposed mappings, as all of them were exposed before
-    assert package0_2_0.is_file()
+    assert exec_extension("package0.2.0") in exposed
 
 
 def test_global_update_single_package_with_transient_dependency(
@@ -1420,14 +1381,11 @@ def test_global_update_all_packages(
         env=env,
     )
 
-    package = tmp_path / "bin" / exec_extension("package")
-    package0_1_0 = tmp_path / "bin" / exec_extension("package0.1.0")
-    package0_2_0 = tmp_path / "bin" / exec_extension("package0.2.0")
-    package2 = tmp_path / "bin" / exec_extension("package2")
-    assert package2.is_file()
-    assert package.is_file()
-    assert package0_1_0.is_file()
-    assert not package0_2_0.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("package2") in exposed
+    assert exec_extension("package") in exposed
+    assert exec_extension("package0.1.0") in exposed
+    assert exec_extension("package0.2.0") not in exposed
 
     # Replace the version with a "*"
     manifest = tmp_path.joinpath("manifests", "pixi-global.toml")
@@ -1437,11 +1395,12 @@ def test_global_update_all_packages(
         [pixi, "global", "update"],
         env=env,
     )
-    assert package2.is_file()
-    assert package.is_file()
-    assert not package0_1_0.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("package2") in exposed
+    assert exec_extension("package") in exposed
+    assert exec_extension("package0.1.0") not in exposed
     # After update be left we auto expose new binary, as all of them were exposed before
-    assert package0_2_0.is_file()
+    assert exec_extension("package0.2.0") in exposed
 
     # Check the manifest for removed binaries
     manifest_content = manifest.read_text()
@@ -1475,14 +1434,11 @@ def test_global_update_multiple_packages_in_one_env(
         env=env,
     )
 
-    package = tmp_path / "bin" / exec_extension("package")
-    package0_1_0 = tmp_path / "bin" / exec_extension("package0.1.0")
-    package0_2_0 = tmp_path / "bin" / exec_extension("package0.2.0")
-    package2 = tmp_path / "bin" / exec_extension("package2")
-    assert package2.is_file()
-    assert package.is_file()
-    assert package0_1_0.is_file()
-    assert not package0_2_0.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("package2") in exposed
+    assert exec_extension("package") in exposed
+    assert exec_extension("package0.1.0") in exposed
+    assert exec_extension("package0.2.0") not in exposed
 
     # Replace the version with a "*"
     manifest = tmp_path.joinpath("manifests", "pixi-global.toml")
@@ -1494,11 +1450,12 @@ def test_global_update_multiple_packages_in_one_env(
         stderr_contains=["- package 0.1.0 -> 0.2.0", "- package2 0.1.0 -> 0.2.0"],
     )
 
-    assert package2.is_file()
-    assert package.is_file()
-    assert not package0_1_0.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("package2") in exposed
+    assert exec_extension("package") in exposed
+    assert exec_extension("package0.1.0") not in exposed
     # After update be left we auto expose new binary, as all of them were exposed before
-    assert package0_2_0.is_file()
+    assert exec_extension("package0.2.0") in exposed
 
     # Check the manifest for removed binaries
     manifest_content = manifest.read_text()
@@ -1515,15 +1472,13 @@ def test_global_update_multiple_packages_in_one_env(
 def test_pixi_update_cleanup(pixi: Path, tmp_path: Path, global_update_channel_1: str) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
 
-    package0_1_0 = tmp_path / "bin" / exec_extension("package0.1.0")
-    package0_2_0 = tmp_path / "bin" / exec_extension("package0.2.0")
-
     verify_cli_command(
         [pixi, "global", "install", "--channel", global_update_channel_1, "package==0.1.0"],
         env=env,
     )
-    assert package0_1_0.is_file()
-    assert not package0_2_0.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("package0.1.0") in exposed
+    assert exec_extension("package0.2.0") not in exposed
 
     manifest = tmp_path.joinpath("manifests", "pixi-global.toml")
 
@@ -1533,8 +1488,9 @@ def test_pixi_update_cleanup(pixi: Path, tmp_path: Path, global_update_channel_1
     parsed_toml["envs"]["package"]["dependencies"]["package"] = "*"
     manifest.write_text(tomli_w.dumps(parsed_toml))
     verify_cli_command([pixi, "global", "sync"], env=env)
-    assert package0_1_0.is_file()
-    assert not package0_2_0.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("package0.1.0") in exposed
+    assert exec_extension("package0.2.0") not in exposed
 
     # Update the environment
     # The package should now have the version `0.2.0` and expose a different executable
@@ -1544,8 +1500,9 @@ def test_pixi_update_cleanup(pixi: Path, tmp_path: Path, global_update_channel_1
         [pixi, "global", "update", "package"],
         env=env,
     )
-    assert not package0_1_0.is_file()
-    assert package0_2_0.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("package0.1.0") not in exposed
+    assert exec_extension("package0.2.0") in exposed
 
 
 def test_pixi_update_subset_expose(
@@ -1553,15 +1510,13 @@ def test_pixi_update_subset_expose(
 ) -> None:
     env = {"PIXI_HOME": str(tmp_path)}
 
-    package0_1_0 = tmp_path / "bin" / exec_extension("package0.1.0")
-    package0_2_0 = tmp_path / "bin" / exec_extension("package0.2.0")
-
     verify_cli_command(
         [pixi, "global", "install", "--channel", global_update_channel_1, "package==0.1.0"],
         env=env,
     )
-    assert package0_1_0.is_file()
-    assert not package0_2_0.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("package0.1.0") in exposed
+    assert exec_extension("package0.2.0") not in exposed
 
     manifest = tmp_path.joinpath("manifests", "pixi-global.toml")
 
@@ -1582,8 +1537,9 @@ def test_pixi_update_subset_expose(
         [pixi, "global", "update", "package"],
         env=env,
     )
-    assert not package0_1_0.is_file()
-    assert not package0_2_0.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("package0.1.0") not in exposed
+    assert exec_extension("package0.2.0") not in exposed
 
     # parse the manifest again
     # and check that we don't have any new binary exposed
@@ -1645,7 +1601,6 @@ def test_add(pixi: Path, tmp_path: Path, dummy_channel_1: str) -> None:
         stderr_contains="Exposed executable dummy-b from environment dummy-a",
     )
     # Make sure it now exposes the binary
-    dummy_b = tmp_path / "bin" / exec_extension("dummy-b")
     assert dummy_b.is_file()
 
 
@@ -1667,9 +1622,9 @@ def test_remove_dependency(pixi: Path, tmp_path: Path, dummy_channel_1: str) ->
         env=env,
     )
     dummy_a = tmp_path / "bin" / exec_extension("dummy-a")
-    dummy_b = tmp_path / "bin" / exec_extension("dummy-b")
-    assert dummy_a.is_file()
-    assert dummy_b.is_file()
+    exposed = bin_contents(tmp_path)
+    assert exec_extension("dummy-a") in exposed
+    assert exec_extension("dummy-b") in exposed
 
     # Remove dummy-a
     verify_cli_command(